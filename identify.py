@@ -1,4 +1,4 @@
-#!/usr/bin/env python2.7
+#!/usr/bin/env python3
 
 #(c) 2015-2016 by Authors
 #This file is a part of Nano-Align program.
@@ -34,13 +34,16 @@ def main():
     parser.add_argument("-s", "--single-nanospectra", action="store_true",
                         default=False, dest="single_nanospectra",
                         help="print statistics for each nanospectra in a cluster")
+    parser.add_argument("-t", "--threads", dest="threads", type=int,
+                        default=1, help="number of parallel processes")
 
     parser.add_argument("--version", action="version", version=__version__)
     args = parser.parse_args()
 
     model = load_model(args.model_file)
     pvalues_test(args.nanospectra_file, args.cluster_size, model,
-                 args.database, args.single_nanospectra, sys.stderr)
+                 args.database, args.single_nanospectra, sys.stderr,
+                 args.threads)
     return 0
 
 
@@ -41,20 +41,29 @@ def read_mat(filename):
     event_traces = struct["eventTrace"]
     num_samples = event_traces.shape[1]
 
+    #fields are flattened once and all traces are copied in a single pass,
+    #one contiguous row per blockade
+    start_points = struct["StartPoint"].squeeze()
+    dwells = struct["ms_Dwell"].squeeze()
+    pa_blockades = struct["pA_Blockade"].squeeze()
+    open_pores = struct["openPore"].squeeze()
+    correlations = struct["correlation"].squeeze()
+    traces = np.array(event_traces.T, order="C")
+
     blockades = []
-    for sample_id in xrange(num_samples):
+    for sample_id in range(num_samples):
         file_tag = struct["fileTag"][sample_id]
-        start_point = float(struct["StartPoint"].squeeze()[sample_id])
-        dwell = float(struct["ms_Dwell"].squeeze()[sample_id])
-        pa_blockade = float(struct["pA_Blockade"].squeeze()[sample_id])
-        open_pore = float(struct["openPore"].squeeze()[sample_id])
-        correlation = float(struct["correlation"].squeeze()[sample_id])
+        start_point = float(start_points[sample_id])
+        dwell = float(dwells[sample_id])
+        pa_blockade = float(pa_blockades[sample_id])
+        open_pore = float(open_pores[sample_id])
+        correlation = float(correlations[sample_id])
         try:
             peptide = str(struct["peptide"][sample_id]).strip()
         except IndexError:
             peptide = None
 
-        trace = np.array(event_traces[:, sample_id])
+        trace = traces[sample_id]
 
         out_struct = Blockade(file_tag, start_point, dwell, pa_blockade,
                               open_pore, trace, correlation, peptide)
@@ -70,14 +79,14 @@ def write_mat(blockades, filename):
     dtype = [("fileTag", "O"), ("StartPoint", "O"), ("ms_Dwell", "O"),
              ("pA_Blockade", "O"), ("eventTrace", "O"), ("openPore", "O"),
              ("correlation", "O"), ("peptide", "O")]
-    file_tag_arr = np.array(map(lambda e: e.fileTag, blockades))
-    peptide_arr = np.array(map(lambda e: e.peptide, blockades))
-    start_arr = np.array(map(lambda e: e.StartPoint, blockades))
-    dwell_arr = np.array(map(lambda e: e.ms_Dwell, blockades))
-    pa_blockade_arr = np.array(map(lambda e: e.pA_Blockade, blockades))
-    open_pore_arr = np.array(map(lambda e: e.openPore, blockades))
-    event_trace_arr = np.array(map(lambda e: e.eventTrace, blockades))
-    corr_arr = np.array(map(lambda e: e.correlation, blockades))
+    file_tag_arr = np.array([e.fileTag for e in blockades])
+    peptide_arr = np.array([e.peptide for e in blockades])
+    start_arr = np.array([e.StartPoint for e in blockades])
+    dwell_arr = np.array([e.ms_Dwell for e in blockades])
+    pa_blockade_arr = np.array([e.pA_Blockade for e in blockades])
+    open_pore_arr = np.array([e.openPore for e in blockades])
+    event_trace_arr = np.array([e.eventTrace for e in blockades])
+    corr_arr = np.array([e.correlation for e in blockades])
 
     struct = (file_tag_arr, [start_arr], [dwell_arr], [pa_blockade_arr],
               np.transpose(event_trace_arr), [open_pore_arr],
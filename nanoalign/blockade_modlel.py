@@ -13,8 +13,9 @@ class ModelDump(object):
 
 
 class BlockadeModel(object):
+    name = None
+
     def __init__(self):
-        self.name = None
         self.predictor = None
         self.window = 4
 
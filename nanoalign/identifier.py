@@ -7,7 +7,7 @@ Protein identification module
 """
 
 import random
-from itertools import izip
+from collections import defaultdict
 import matplotlib.pyplot as plt
 import matplotlib
 import numpy as np
@@ -19,6 +19,7 @@ class Identifier(object):
     def __init__(self, blockade_model):
         self.blockade_model = blockade_model
         self.database = None
+        self.db_signals = None
 
     def signal_protein_distance(self, signal, peptide):
         theor_signal = self.blockade_model.peptide_signal(peptide)
@@ -26,10 +27,10 @@ class Identifier(object):
 
     def set_database(self, database):
         """
-        Sets protein database. If parameter is None, random
-        database is generated
+        Sets protein database
         """
         self.database = database
+        self.db_signals = None
 
     def random_database(self, protein, size):
         """
@@ -40,12 +41,12 @@ class Identifier(object):
         weights_list = list(protein)
         database = {}
         database["target"] = protein
-        for i in xrange(size):
+        for i in range(size):
             random.shuffle(weights_list)
             decoy_name = "decoy_{0}".format(i)
             database[decoy_name] = "".join(weights_list)
 
-        self.database = database
+        self.set_database(database)
 
     def identify(self, signal):
         """
@@ -59,18 +60,43 @@ class Identifier(object):
         """
         assert self.database is not None
 
-        distances = {}
-        discretized = {}
+        self.compute_db_signals()
+        distances = []
+        for prot_len, (prot_ids, theor_signals) in self.db_signals.items():
+            discr_signal = np.array(sp.discretize(signal, prot_len))
+            residuals = np.sum((theor_signals - discr_signal) ** 2, axis=1)
+            distances.extend(zip(prot_ids,
+                                 residuals / _sum_squares(discr_signal)))
+
+        return sorted(distances, key=lambda i: i[1])
+
+    def compute_db_signals(self):
+        """
+        Computes theoretical signals of the database proteins,
+        unless they are already computed. They do not depend on
+        the query signal, so they are computed once per database
+        """
+        if self.db_signals is None:
+            self.db_signals = self._signals_by_length()
 
+    def _signals_by_length(self):
+        """
+        Groups database proteins by length. Theoretical signals of
+        each group are stored as a single matrix (one row per protein),
+        so a group is compared against a signal at once
+        """
+        prot_ids_by_length = defaultdict(list)
         for prot_id, prot_seq in self.database.items():
-            if len(prot_seq) not in discretized:
-                discretized[len(prot_seq)] = sp.discretize(signal, len(prot_seq))
+            prot_ids_by_length[len(prot_seq)].append(prot_id)
 
-            distance = self.signal_protein_distance(discretized[len(prot_seq)],
-                                                    prot_seq)
-            distances[prot_id] = distance
+        model = self.blockade_model
+        signals_by_length = {}
+        for prot_len, prot_ids in prot_ids_by_length.items():
+            theor_signals = np.array([model.peptide_signal(self.database[p])
+                                      for p in prot_ids])
+            signals_by_length[prot_len] = (prot_ids, theor_signals)
 
-        return sorted(distances.items(), key=lambda i: i[1])
+        return signals_by_length
 
 
 def _signals_distance(real_signal, model_signal):
@@ -78,6 +104,12 @@ def _signals_distance(real_signal, model_signal):
     Computes distance as 1 - R_squared statistic
     """
     residuals = distance.sqeuclidean(real_signal, model_signal)
-    mean = float(sum(real_signal)) / len(real_signal)
-    variance = sum((x - mean) ** 2 for x in real_signal)
-    return residuals / variance
+    return residuals / _sum_squares(real_signal)
+
+
+def _sum_squares(signal):
+    """
+    Computes the sum of squared deviations from the mean
+    """
+    signal = np.asarray(signal, dtype=float)
+    return np.sum((signal - signal.mean()) ** 2)
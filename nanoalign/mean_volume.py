@@ -12,29 +12,17 @@ from nanoalign.blockade_modlel import BlockadeModel
 
 
 class MvBlockade(BlockadeModel):
-    def __init__(self):
-        super(MvBlockade, self).__init__()
-        self.name = "MeanVolume"
-        self.cache = {}
+    name = "MeanVolume"
 
     def peptide_signal(self, peptide):
         """
         Generates theoretical signal for a given peptide
         """
-        flanked_peptide = ("-" * (self.window - 1) + peptide +
-                           "-" * (self.window - 1))
-        num_peaks = len(peptide) + self.window - 1
-        signal = []
-        for i in xrange(0, num_peaks):
-            kmer = flanked_peptide[i : i + self.window]
-            signal.append(self._signal(kmer))
+        #mean volumes of all kmers of the gap-flanked peptide
+        #are obtained at once as a (full) convolution with a box window
+        volumes = np.array([self.volumes[aa] for aa in peptide])
+        kmer_sums = np.convolve(volumes, np.ones(self.window, dtype=int))
+        signal = kmer_sums / self.window
 
         signal = (signal - np.mean(signal)) / np.std(signal)
         return signal
-
-    def _signal(self, kmer):
-        if not kmer in self.cache:
-            volumes = np.array(map(self.volumes.get, kmer))
-            unscaled = sum(volumes) / len(kmer)
-            self.cache[kmer] = unscaled
-        return self.cache[kmer]
@@ -13,17 +13,18 @@ from nanoalign.random_forest import RandomForestBlockade
 from nanoalign.mean_volume import MvBlockade
 
 
+#model name (as stored in dump) -> model class
+_MODEL_TYPES = dict((model_type.name, model_type)
+                    for model_type in [SvrBlockade, RandomForestBlockade])
+
+
 def load_model(filename):
     if filename == "-":
         return MvBlockade()
 
-    dump = pickle.load(open(filename, "rb"))
-
-    if dump.name == SvrBlockade().name:
-        model = SvrBlockade()
-    elif dump.name == RandomForestBlockade().name:
-        model = RandomForestBlockade()
-
+    #latin1 allows reading numpy arrays from dumps made under Python 2
+    dump = pickle.load(open(filename, "rb"), encoding="latin1")
+    model = _MODEL_TYPES[dump.name]()
     model.load_from_dump(dump)
     return model
 
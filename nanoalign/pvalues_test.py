@@ -7,6 +7,7 @@ Performs identification test and report p-values
 """
 
 from collections import defaultdict
+from multiprocessing import Pool
 
 from Bio import SeqIO
 import numpy as np
@@ -30,8 +31,39 @@ def _make_database(db_file, peptide):
     return database, target_id
 
 
+def _rank_clusters(identifier, clusters, num_proc):
+    """
+    Ranks database proteins for each cluster's consensus.
+    Clusters are independent, so they are distributed among
+    num_proc worker processes
+    """
+    consensuses = [cl.consensus for cl in clusters]
+    if num_proc <= 1:
+        return [identifier.rank_db_proteins(c) for c in consensuses]
+
+    #database signals are computed before forking,
+    #so the workers inherit them rather than recompute
+    identifier.compute_db_signals()
+    pool = Pool(num_proc, initializer=_init_worker, initargs=(identifier,))
+    try:
+        return pool.map(_rank_worker, consensuses)
+    finally:
+        pool.close()
+        pool.join()
+
+
+_worker_identifier = None
+def _init_worker(identifier):
+    global _worker_identifier
+    _worker_identifier = identifier
+
+
+def _rank_worker(signal):
+    return _worker_identifier.rank_db_proteins(signal)
+
+
 def pvalues_test(blockades_file, cluster_size, blockade_model, db_file,
-                 single_blockades, ostream):
+                 single_blockades, ostream, num_proc=1):
     """
     Performs protein identification and report results
     """
@@ -56,9 +88,8 @@ def pvalues_test(blockades_file, cluster_size, blockade_model, db_file,
                      "Trg_pval\n")
     p_values = []
     ranks = []
-    for num, cluster in enumerate(clusters):
-        db_ranking = identifier.rank_db_proteins(cluster.consensus)
-
+    db_rankings = _rank_clusters(identifier, clusters, num_proc)
+    for num, (cluster, db_ranking) in enumerate(zip(clusters, db_rankings)):
         target_rank = None
         target_dist = None
         for rank, (prot_id, prot_dist) in enumerate(db_ranking):
@@ -92,7 +123,7 @@ def _detalize_cluster(identifier, cluster, top_id, target_id, ostream):
     global_rankings = defaultdict(list)
     for num, cluster in enumerate(single_blockades):
         rankings = identifier.rank_db_proteins(cluster.consensus)
-        for i in xrange(len(rankings)):
+        for i in range(len(rankings)):
             global_rankings[rankings[i][0]].append(i)
             if rankings[i][0] == target_id:
                 target_rank = i
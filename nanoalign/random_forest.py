@@ -14,21 +14,22 @@ from nanoalign.blockade_modlel import BlockadeModel
 
 
 class RandomForestBlockade(BlockadeModel):
+    name = "RandomForest"
+
     def __init__(self):
         super(RandomForestBlockade, self).__init__()
-        self.name = "RandomForest"
         self.rf_cache = {}
 
 
     def train(self, peptides, signals):
-        features = map(lambda p: self._peptide_to_features(p, shuffle=True),
-                       peptides)
+        features = [self._peptide_to_features(p, shuffle=True)
+                    for p in peptides]
         train_features = np.array(sum(features, []))
 
         #regulzrisation
         noise_features = []
         for data in train_features:
-            noise_features.append(map(lambda f: f + random.gauss(0, 10), data))
+            noise_features.append([f + random.gauss(0, 10) for f in data])
         ##
 
         train_signals = np.array(sum(signals, []))
@@ -57,13 +58,13 @@ class RandomForestBlockade(BlockadeModel):
         assert self.predictor is not None
 
         features = self._peptide_to_features(peptide, shuffle=False)
-        signal = np.array(map(lambda x: self._rf_predict(x), features))
+        signal = np.array([self._rf_predict(x) for x in features])
         #signal = signal / np.std(signal)
         return signal
 
     def _peptide_to_features(self, peptide, shuffle):
-        volumes = map(self.volumes.get, peptide)
-        hydro = map(self.hydro.get, peptide)
+        volumes = [self.volumes[aa] for aa in peptide]
+        hydro = [self.hydro[aa] for aa in peptide]
         num_peaks = len(volumes) + self.window - 1
         flanked_volumes = ([0] * (self.window - 1) + volumes +
                            [0] * (self.window - 1))
@@ -71,14 +72,14 @@ class RandomForestBlockade(BlockadeModel):
                          [0] * (self.window - 1))
 
         features = []
-        for i in xrange(0, num_peaks):
+        for i in range(0, num_peaks):
             v = flanked_volumes[i : i + self.window]
             #if shuffle:
             #    random.shuffle(v)
             #features.append(tuple(v))
 
             h = flanked_hydro[i : i + self.window]
-            combined = zip(v, h)
+            combined = list(zip(v, h))
             if shuffle:
                 random.shuffle(combined)
             features.append(tuple(list(chain(*combined))))
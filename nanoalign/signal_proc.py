@@ -11,7 +11,7 @@ import sys
 from collections import namedtuple, defaultdict
 import numpy as np
 import random
-from copy import deepcopy
+from copy import copy
 
 from nanoalign.blockade import BlockadeCluster
 
@@ -38,16 +38,19 @@ def discretize(signal, protein_length):
     WINDOW = 4
     num_peaks = protein_length + WINDOW - 1
 
-    discrete = []
-    peak_shift = len(signal) / (num_peaks - 1)
-    for i in xrange(0, num_peaks):
-        signal_pos = i * (peak_shift - 1)
-        #discrete.append(signal[signal_pos])
-        left = max(0, signal_pos - peak_shift / 2)
-        right = min(len(signal), signal_pos + peak_shift / 2)
-        discrete.append(np.mean(signal[left:right]))
+    signal = np.asarray(signal, dtype=float)
+    peak_shift = len(signal) // (num_peaks - 1)
+    signal_pos = np.arange(num_peaks) * (peak_shift - 1)
+    #bounds are clipped to the signal, so that windows of too short
+    #signals are empty (and give NaN) instead of being out of range
+    left = np.clip(signal_pos - peak_shift // 2, 0, len(signal))
+    right = np.clip(signal_pos + peak_shift // 2, 0, len(signal))
 
-    return discrete
+    #window means for all peaks from a single cumulative sum
+    cumsum = np.concatenate(([0.0], np.cumsum(signal)))
+    discrete = (cumsum[right] - cumsum[left]) / (right - left)
+
+    return discrete.tolist()
 
 
 def find_peaks(signal, minimum=False, ranged=False):
@@ -57,23 +60,30 @@ def find_peaks(signal, minimum=False, ranged=False):
     signal = np.array(signal)
     WINDOW = 10
 
-    peaks = []
-    for pos in xrange(WINDOW, len(signal) - WINDOW):
-        left = signal[pos - WINDOW: pos] - signal[pos]
-        right = signal[pos + 1: pos + WINDOW + 1] - signal[pos]
-
-        if not minimum:
-            if (left < 0).all() and (right < 0).all():
-                peaks.append((pos, abs(np.mean(left) + np.mean(right))))
-        else:
-            if (left > 0).all() and (right > 0).all():
-                peaks.append((pos, signal[pos]))
+    #compares all positions against their neighbours at once,
+    #shifting the whole position vector by each window offset
+    positions = np.arange(WINDOW, len(signal) - WINDOW)
+    pos_values = signal[positions]
+    is_peak = np.ones(len(positions), dtype=bool)
+    diff_sum = np.zeros(len(positions))
+    for shift in range(1, WINDOW + 1):
+        for neighbours in (signal[positions - shift],
+                           signal[positions + shift]):
+            diff = neighbours - pos_values
+            is_peak &= (diff > 0) if minimum else (diff < 0)
+            diff_sum += diff
+
+    if not minimum:
+        scores = np.abs(diff_sum / WINDOW)
+    else:
+        scores = pos_values
+    peaks = list(zip(positions[is_peak].tolist(), scores[is_peak].tolist()))
 
     selected = sorted(peaks, key=lambda p: p[1], reverse=not minimum)
-    xx = map(lambda p: p[0], selected)
+    xx = [p[0] for p in selected]
     if not ranged:
         xx.sort()
-    yy = map(lambda p: signal[p], xx)
+    yy = [signal[p] for p in xx]
     return xx, yy
 
 
@@ -95,17 +105,24 @@ def _trim_flank_noise(signal):
     Trims noisy flanking region
     """
     WINDOW = int(0.01 * len(signal))
+    samples = np.asarray(signal)
+
     def find_local_minima(pos_iter):
+        #for each position, counts samples in the surrounding window
+        #that are higher than the position itself. Scores for all positions
+        #are computed at once, shifting the whole position vector
+        positions = np.array(list(pos_iter), dtype=int)
+        pos_values = samples[positions]
+        scores = np.zeros(len(positions), dtype=int)
+        for shift in range(1, WINDOW // 2 + 1):
+            scores += samples[positions - shift] > pos_values
+        for shift in range(1, WINDOW // 2):
+            scores += samples[positions + shift] > pos_values
+
         max_good = 0
         max_pos = iter(pos_iter)
         prev_good = False
-        for pos in pos_iter:
-            left = signal[pos - WINDOW / 2: pos]
-            right = signal[pos: pos + WINDOW / 2]
-            left_good = len(filter(lambda d: d > signal[pos], left))
-            right_good = len(filter(lambda d: d > signal[pos], right))
-            score = left_good + right_good
-
+        for pos, score in zip(pos_iter, scores):
             if max_good < score:
                 max_good = score
                 max_pos = pos
@@ -117,9 +134,9 @@ def _trim_flank_noise(signal):
                     break
         return max_pos
 
-    left = find_local_minima(xrange(WINDOW / 2, int(0.05 * len(signal))))
-    right = find_local_minima(xrange(len(signal) - WINDOW / 2,
-                                     int(0.95 * len(signal)), -1))
+    left = find_local_minima(range(WINDOW // 2, int(0.05 * len(signal))))
+    right = find_local_minima(range(len(signal) - WINDOW // 2,
+                                    int(0.95 * len(signal)), -1))
 
     return signal[left : right]
 
@@ -128,7 +145,8 @@ def _fractional_blockades(blockades):
     """
     Converts blockades curents to fractional values
     """
-    blockades = deepcopy(blockades)
+    #traces are replaced rather than modified, so shallow copies suffice
+    blockades = [copy(b) for b in blockades]
     for blockade in blockades:
         if np.median(blockade.eventTrace) < 0:
             blockade.eventTrace = 1 - blockade.eventTrace / blockade.openPore
@@ -138,15 +156,6 @@ def _fractional_blockades(blockades):
     return blockades
 
 
-def _get_consensus(signals):
-    """
-    Calculates consensus of multiple signals
-    """
-    matrix = np.array(map(lambda e: e.eventTrace, signals))
-    medians = np.mean(matrix, axis=0)
-    return medians
-
-
 def _normalize(signal):
     """
     Signal normalization
@@ -159,12 +168,14 @@ def _random_cluster(blockades, bin_size):
     Randomly splits blockades into clusters and calculates a consensus
     """
     averages = []
-    blockades = deepcopy(blockades)
+    blockades = list(blockades)
     if bin_size > 1:
         random.shuffle(blockades)
-    for event_bin in xrange(0, len(blockades) / bin_size):
-        cl_blockades = blockades[event_bin*bin_size : (event_bin+1)*bin_size]
-        avg_signal = _get_consensus(cl_blockades)
-        averages.append(BlockadeCluster(avg_signal, cl_blockades))
+    #traces are stacked once, so each consensus is a single reduction
+    traces = np.array([b.eventTrace for b in blockades])
+    for event_bin in range(0, len(blockades) // bin_size):
+        bin_slice = slice(event_bin * bin_size, (event_bin + 1) * bin_size)
+        avg_signal = np.mean(traces[bin_slice], axis=0)
+        averages.append(BlockadeCluster(avg_signal, blockades[bin_slice]))
 
     return averages
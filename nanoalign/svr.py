@@ -7,7 +7,6 @@ SVR model for theoretical signal generation
 """
 
 from __future__ import print_function
-from string import maketrans
 
 import numpy as np
 from sklearn.svm import SVR
@@ -16,27 +15,32 @@ from nanoalign.blockade_modlel import BlockadeModel
 
 
 class SvrBlockade(BlockadeModel):
+    name = "SVR"
+
     def __init__(self):
         super(SvrBlockade, self).__init__()
-        self.name = "SVR"
-        self.svr_cache = {}
+        self.kmer_features = _kmer_feature_table(self.window)
+        self.svr_cache = None
 
-    def _svr_predict(self, feature_vec):
+    def _fill_cache(self):
         """
-        Predicts signal for a feature vector
+        Predicts signals for all possible kmers with a single SVR call.
+        The result is indexed by kmer code
         """
-        if feature_vec not in self.svr_cache:
-            np_feature = np.array(feature_vec).reshape(1, -1)
-            self.svr_cache[feature_vec] = self.predictor.predict(np_feature)[0]
-        return self.svr_cache[feature_vec]
+        self.svr_cache = self.predictor.predict(self.kmer_features)
 
     def train(self, peptides, signals, C=1000, gamma=0.001, epsilon=0.01):
         """
         Trains SVR model
         """
         self.predictor = SVR(kernel="rbf", C=C, gamma=gamma, epsilon=epsilon)
-        features = map(lambda p: self._peptide_to_features(p), peptides)
-        train_features = np.array(sum(features, []))
+        self.svr_cache = None
+        #peptides are repeated for each training signal,
+        #so features are computed once per distinct peptide
+        peptide_features = dict((p, self._peptide_to_features(p))
+                                for p in set(peptides))
+        features = [peptide_features[p] for p in peptides]
+        train_features = np.vstack(features)
         train_signals = np.array(sum(signals, []))
         assert len(train_features) == len(train_signals)
 
@@ -49,42 +53,65 @@ class SvrBlockade(BlockadeModel):
         """
         assert self.predictor is not None
 
-        features = self._peptide_to_features(peptide)
-        signal = np.array(map(lambda x: self._svr_predict(x), features))
+        if self.svr_cache is None:
+            self._fill_cache()
+
+        signal = self.svr_cache[self._kmer_codes(peptide)]
         #normalize the signal's amplitude
         signal = signal / np.std(signal)
         return signal
 
     def _peptide_to_features(self, peptide):
         """
-        Converts peptide into a list of feature vectors
+        Converts peptide into a matrix of feature vectors (one per kmer)
+        """
+        return self.kmer_features[self._kmer_codes(peptide)]
+
+    def _kmer_codes(self, peptide):
+        """
+        Encodes each kmer of the gap-flanked peptide as an integer:
+        weight ids of the kmer are the digits in base NUM_WEIGHTS
         """
         aa_weights = _aa_to_weights(peptide)
         num_peaks = len(aa_weights) + self.window - 1
         flanked_peptide = ("-" * (self.window - 1) + aa_weights +
                            "-" * (self.window - 1))
-        features = []
-        for i in xrange(0, num_peaks):
-            kmer = flanked_peptide[i : i + self.window]
-            feature = _kmer_to_features(kmer)
-            features.append(feature)
+        weight_ids = WEIGHT_TO_ID[np.frombuffer(flanked_peptide.encode("ascii"),
+                                                dtype=np.uint8)]
 
-        return features
+        codes = np.zeros(num_peaks, dtype=int)
+        for i in range(self.window):
+            codes = codes * NUM_WEIGHTS + weight_ids[i : i + num_peaks]
+        return codes
 
 
-def _kmer_to_features(kmer):
+def _kmer_feature_table(window):
     """
-    Converts kmer in reduced alphabet into a feature vector
+    Precomputes feature vectors for all kmer codes of the given size
     """
-    miniscule = kmer.count("M")
-    small = kmer.count("S")
-    intermediate = kmer.count("I")
-    large = kmer.count("L")
-    return (large, intermediate, small, miniscule)
-
-
-AA_SIZE_TRANS = maketrans("GASCUTDPNVBEQZHLIMKXRFYW-",
-                          "MMMMMSSSSSSIIIIIIIIILLLL-")
+    codes = np.arange(NUM_WEIGHTS ** window)
+    table = np.zeros((len(codes), NUM_FEATURES), dtype=int)
+    for _ in range(window):
+        weight_ids = codes % NUM_WEIGHTS
+        for feature_id in range(NUM_FEATURES):
+            table[:, feature_id] += weight_ids == feature_id
+        codes = codes // NUM_WEIGHTS
+    return table
+
+
+#kmer feature vector is (large, intermediate, small, miniscule) counts,
+#gaps (and unknown symbols) are not counted
+WEIGHTS = "LISM-"
+NUM_WEIGHTS = len(WEIGHTS)
+NUM_FEATURES = 4
+WEIGHT_TO_ID = np.empty(256, dtype=int)
+WEIGHT_TO_ID.fill(WEIGHTS.index("-"))
+for weight_id, weight in enumerate(WEIGHTS):
+    WEIGHT_TO_ID[ord(weight)] = weight_id
+
+
+AA_SIZE_TRANS = str.maketrans("GASCUTDPNVBEQZHLIMKXRFYW-",
+                              "MMMMMSSSSSSIIIIIIIIILLLL-")
 def _aa_to_weights(kmer):
     """
     Converts AAs into the reduced alphabet
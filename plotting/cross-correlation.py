@@ -1,4 +1,4 @@
-#!/usr/bin/env python2.7
+#!/usr/bin/env python3
 
 #(c) 2015-2016 by Authors
 #This file is a part of Nano-Align program.
@@ -15,7 +15,6 @@ import os
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib
-from scipy.spatial import distance
 
 nanoalign_root = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
 sys.path.insert(0, nanoalign_root)
@@ -31,24 +30,20 @@ def correlation(mat_file_1, mat_file_2):
     blockades_1 = read_mat(mat_file_1)
     blockades_1 = sp._fractional_blockades(blockades_1)
     blockades_1 = sp._filter_by_duration(blockades_1, 0.5, 20)
-    blockades_1 = map(lambda b: sp.discretize(sp._trim_flank_noise(b.eventTrace), 20), blockades_1)
+    blockades_1 = [sp.discretize(sp._trim_flank_noise(b.eventTrace), 20)
+                   for b in blockades_1]
 
     blockades_2 = read_mat(mat_file_2)
     blockades_2 = sp._fractional_blockades(blockades_2)
     blockades_2 = sp._filter_by_duration(blockades_2, 0.5, 20)
-    blockades_2 = map(lambda b: sp.discretize(sp._trim_flank_noise(b.eventTrace), 20), blockades_2)
-
-    self_corr = []
-    cross_corr = []
-    for blockade in blockades_1:
-        block_self = []
-        for other in blockades_1:
-            block_self.append(1 - distance.correlation(blockade, other))
-        block_cross = []
-        for other in blockades_2:
-            block_cross.append(1 - distance.correlation(blockade, other))
-        self_corr.append(np.mean(block_self))
-        cross_corr.append(np.mean(block_cross))
+    blockades_2 = [sp.discretize(sp._trim_flank_noise(b.eventTrace), 20)
+                   for b in blockades_2]
+
+    #correlations between all pairs of signals at once
+    corr_matrix = np.corrcoef(np.vstack((blockades_1, blockades_2)))
+    num_first = len(blockades_1)
+    self_corr = np.mean(corr_matrix[:num_first, :num_first], axis=1)
+    cross_corr = np.mean(corr_matrix[:num_first, num_first:], axis=1)
 
     mean_self = np.median(self_corr)
     mean_cross = np.median(cross_corr)
@@ -1,4 +1,4 @@
-#!/usr/bin/env python2.7
+#!/usr/bin/env python3
 
 #(c) 2015-2016 by Authors
 #This file is a part of Nano-Align program.
@@ -34,9 +34,9 @@ def savitsky_golay(y, window_size, order, deriv=0, rate=1):
     (taken from http://scipy.github.io/old-wiki/pages/Cookbook/SavitzkyGolay)
     """
     try:
-       window_size = np.abs(np.int(window_size))
-       order = np.abs(np.int(order))
-    except ValueError, msg:
+       window_size = np.abs(int(window_size))
+       order = np.abs(int(order))
+    except ValueError:
        raise ValueError("window_size and order have to be of type int")
     if window_size % 2 != 1 or window_size < 1:
        raise TypeError("window_size size must be a positive odd number")
@@ -57,7 +57,7 @@ def gcd_fuzz(numbers):
     Computes "approximate" common divisor
     """
     vals = []
-    for div in xrange(1, 300):
+    for div in range(1, 300):
         rems = []
         for num in numbers:
             rem = min(num % div, (num // div + 1) * div - num)
@@ -66,7 +66,7 @@ def gcd_fuzz(numbers):
         vals.append(np.mean(rems) / div)
 
     gcd_x, gcd_y = sp.find_peaks(vals, minimum=True, ranged=True)
-    gcds = filter(lambda x: 40 < x < 500, gcd_x)
+    gcds = [x for x in gcd_x if 40 < x < 500]
 
     return vals, gcds
 
@@ -88,13 +88,13 @@ def frequency_distribution(blockades_file, detailed):
         xx, yy = sp.find_peaks(signal)
         peaks_count[blockade] = len(xx) / blockade.ms_Dwell * 5 / 4
 
-    mean = np.mean(peaks_count.values())
-    errors = map(lambda e: peaks_count[e] - mean, blockades)
-    lengths = map(lambda e: e.ms_Dwell, blockades)
+    mean = np.mean(list(peaks_count.values()))
+    errors = [peaks_count[e] - mean for e in blockades]
+    lengths = [e.ms_Dwell for e in blockades]
 
     f, (s1, s2) = plt.subplots(2)
     s1.scatter(lengths, errors)
-    s2.hist(peaks_count.values(), bins=100)
+    s2.hist(list(peaks_count.values()), bins=100)
     plt.show()
 
 
@@ -120,7 +120,7 @@ def detailed_plots(blockade):
 
     #Guessing gcds of peak distance distributino
     hist_x, hist_y = sp.find_peaks(smooth_diff)
-    char_peaks = map(lambda x: int(bin_edges[x + 1]), hist_x)
+    char_peaks = [int(bin_edges[x + 1]) for x in hist_x]
     gcd_plot, gcds = gcd_fuzz(char_peaks)
 
     f, (s1, s2, s3, s4) = plt.subplots(4)
@@ -1,4 +1,4 @@
-#!/usr/bin/env python2.7
+#!/usr/bin/env python3
 
 #(c) 2015-2016 by Authors
 #This file is a part of Nano-Align program.
@@ -34,9 +34,9 @@ def full_identify(blockades_file, model_file, db_file):
     #svr_model.load_from_pickle(svr_file)
 
     boxes = []
-    for avg in xrange(1, 21):
+    for avg in range(1, 21):
         p_values = []
-        for _ in xrange(avg):
+        for _ in range(avg):
             p_value, rank = pvalues_test(blockades_file, avg, blockade_model, db_file,
                                          False, open(os.devnull, "w"))
             p_values.append(p_value)
@@ -64,7 +64,7 @@ def plot_pvalues(pvalues):
     fig = plt.subplot()
 
     x_axis = range(1, len(pvalues) + 1)
-    pvalues_medians = map(np.median, pvalues)
+    pvalues_medians = [np.median(p) for p in pvalues]
 
     fig.errorbar(x_axis, pvalues_medians, fmt="o-",
                  label="p-values", linewidth=1.5)
@@ -81,7 +81,7 @@ def plot_pvalues(pvalues):
 
     fig.set_xlabel("Consensus size")
     fig.set_ylabel("Median p-value")
-    fig.set_yscale("log", nonposy="clip")
+    fig.set_yscale("log", nonpositive="clip")
 
     plt.show()
 
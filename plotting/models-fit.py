@@ -1,4 +1,4 @@
-#!/usr/bin/env python2.7
+#!/usr/bin/env python3
 
 #(c) 2015-2016 by Authors
 #This file is a part of Nano-Align program.
@@ -14,7 +14,6 @@ import sys
 import os
 import argparse
 
-from scipy.interpolate import interp1d
 from scipy.spatial import distance
 import matplotlib.pyplot as plt
 import matplotlib
@@ -44,6 +43,8 @@ def plot_blockades(blockades_file, model_files,
     models = []
     for model_file in model_files:
         models.append(load_model(model_file))
+    #the peptide is the same for all clusters
+    model_signals = [model.peptide_signal(peptide) for model in models]
     #svr_signal = model.peptide_signal(peptide)
     #mv_signal = MvBlockade().peptide_signal(peptide)
 
@@ -66,13 +67,11 @@ def plot_blockades(blockades_file, model_files,
         fig.plot(x_axis, cluster.consensus, label="Empirical signal", linewidth=1.5)
 
         ################
-        for model in models:
-            model_signal = model.peptide_signal(peptide)
+        for model, model_signal in zip(models, model_signals):
             model_grid = [i * signal_length / (len(model_signal) - 1)
-                          for i in xrange(len(model_signal))]
-
-            interp_fun = interp1d(model_grid, model_signal, kind="linear")
-            model_interp = interp_fun(xrange(signal_length))
+                          for i in range(len(model_signal))]
+            model_interp = np.interp(np.arange(signal_length),
+                                     model_grid, model_signal)
 
             corr = 1 - distance.correlation(cluster.consensus, model_interp)
             print("{0} correlation: {1:5.2f}\t".format(model.name, corr),
@@ -104,7 +103,7 @@ def _get_aa_positions(peptide, window_size, plot_len):
     peak_shift = float(plot_len) / (num_peaks - 1)
     initial_shift = (window_size - 1) * peak_shift / 2
     positions = []
-    for aa in xrange(len(peptide)):
+    for aa in range(len(peptide)):
         positions.append(initial_shift + aa * peak_shift)
     return positions
 
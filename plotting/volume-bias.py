@@ -1,4 +1,4 @@
-#!/usr/bin/env python2.7
+#!/usr/bin/env python3
 
 #(c) 2015-2016 by Authors
 #This file is a part of Nano-Align program.
@@ -49,7 +49,7 @@ def get_bias(blockades_file, model_file, cluster_size):
                            "-" * (WINDOW - 1))
         num_peaks = len(peptide) + WINDOW - 1
 
-        for i in xrange(0, num_peaks):
+        for i in range(0, num_peaks):
             kmer = flanked_peptide[i : i + WINDOW]
             if "-" not in kmer:
                 for aa in kmer:
@@ -79,10 +79,10 @@ def fancy_plot(errors, plot_type):
         sorted_aa = sorted(errors.keys(), key=VOLUMES.get)
     else:
         sorted_aa = sorted(errors.keys(), key=HYDRO.get)
-    sorted_values = map(errors.get, sorted_aa)
+    sorted_values = [errors[aa] for aa in sorted_aa]
 
     x_axis = range(1, len(sorted_aa) + 1)
-    medians = map(lambda x: np.median(x), sorted_values)
+    medians = [np.median(x) for x in sorted_values]
     print("P-value:", linregress(x_axis, medians)[3])
     poly = np.polyfit(x_axis, medians, 1)
     poly_fun = np.poly1d(poly)
@@ -1,4 +1,4 @@
-#!/usr/bin/env python2.7
+#!/usr/bin/env python3
 
 #(c) 2015-2016 by Authors
 #This file is a part of Nano-Align program.
@@ -25,12 +25,10 @@ from nanoalign.model_loader import store_model
 from nanoalign.svr import SvrBlockade
 
 
-def _train_svr(mat_files, C=1000, gamma=0.001, epsilon=0.01):
+def _train_svr(peptides, signals, C=1000, gamma=0.001, epsilon=0.01):
     """
     Trains SVR with the given parameters
     """
-    peptides, signals = _get_peptides_signals(mat_files)
-
     model = SvrBlockade()
     model.train(peptides, signals, C, gamma, epsilon)
     return model
@@ -64,14 +62,18 @@ def _cross_validate(train_mats, cv_mats, db_file, out_file):
     C_vec = [1, 10, 100, 1000, 10000, 100000]
     gamma_vec = [0.00001, 0.0001, 0.001, 0.01, 0.1, 1]
 
-    best_score = sys.maxint
+    best_score = float("inf")
     best_params = None
 
+    #training signals are the same for every parameters combination
+    train_peptides, train_signals = _get_peptides_signals(train_mats)
+
     print("C\tGam\tEps\tScore", file=sys.stderr)
     for C in C_vec:
         for gamma in gamma_vec:
             for eps in eps_vec:
-                temp_model = _train_svr(train_mats, C, gamma, eps)
+                temp_model = _train_svr(train_peptides, train_signals,
+                                        C, gamma, eps)
 
                 scores = []
                 for cv_mat in cv_mats:
@@ -88,7 +90,7 @@ def _cross_validate(train_mats, cv_mats, db_file, out_file):
                     best_params = (C, gamma, eps)
 
     print(*best_params, file=sys.stderr)
-    best_model = _train_svr(train_mats, *best_params)
+    best_model = _train_svr(train_peptides, train_signals, *best_params)
     store_model(best_model, out_file)
 
 
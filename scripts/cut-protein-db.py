@@ -1,4 +1,4 @@
-#!/usr/bin/env python2.7
+#!/usr/bin/env python3
 
 #(c) 2015-2016 by Authors
 #This file is a part of Nano-Align program.
@@ -23,8 +23,8 @@ def main():
     fasta_db = sys.argv[1]
     min_len = int(sys.argv[2])
     max_len = int(sys.argv[3])
-    SeqIO.write(filter(lambda s: min_len <= len(s.seq) <= max_len,
-                       SeqIO.parse(fasta_db, "fasta")), sys.stdout, "fasta")
+    SeqIO.write((s for s in SeqIO.parse(fasta_db, "fasta")
+                 if min_len <= len(s.seq) <= max_len), sys.stdout, "fasta")
     return 0
 
 
@@ -1,4 +1,4 @@
-#!/usr/bin/env python2.7
+#!/usr/bin/env python3
 
 #(c) 2015-2016 by Authors
 #This file is a part of Nano-Align program.
@@ -14,7 +14,7 @@ import os
 
 nanoalign_root = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
 sys.path.insert(0, nanoalign_root)
-from nanoalign.identifier import Identifier
+from nanoalign.identifier import _signals_distance
 from nanoalign.blockade import read_mat, write_mat
 import nanoalign.signal_proc as sp
 from nanoalign.model_loader import load_model
@@ -25,9 +25,11 @@ def flip(blockades, model_file):
     Flips blockades
     """
     blockade_model = load_model(model_file)
-    identifier = Identifier(blockade_model)
 
     peptide = blockades[0].peptide
+    #theoretical signals are the same for all blockades
+    fwd_signal = blockade_model.peptide_signal(peptide)
+    rev_signal = blockade_model.peptide_signal(peptide[::-1])
     clusters = sp.preprocess_blockades(blockades, cluster_size=1,
                                        min_dwell=0.0, max_dwell=1000)
 
@@ -38,9 +40,8 @@ def flip(blockades, model_file):
     for num, cluster in enumerate(clusters):
         discr_signal = sp.discretize(cluster.consensus, len(peptide))
 
-        fwd_dist = identifier.signal_protein_distance(discr_signal, peptide)
-        rev_dist = identifier.signal_protein_distance(discr_signal,
-                                                      peptide[::-1])
+        fwd_dist = _signals_distance(discr_signal, fwd_signal)
+        rev_dist = _signals_distance(discr_signal, rev_signal)
         print("{0}\t{1:5.2f}\t{2:5.2f}\t\t{3}"
                 .format(num + 1, fwd_dist, rev_dist, fwd_dist > rev_dist),
                 file=sys.stderr)